@@ -3,15 +3,28 @@
 import os
 import re
 import logging
-from typing import List, Dict, Optional, Set, Any
+from typing import List, Dict, Optional, Set, Tuple, Any
 
 from github import Github, GithubException
 from github.PullRequest import PullRequest
 from github.Issue import Issue
+from github.Repository import Repository
 from github.Commit import Commit
 
 logger = logging.getLogger(__name__)
 
+# Largest page size the GitHub REST API accepts; fewer round-trips per listing
+GITHUB_PAGE_SIZE = 100
+
+# Hunk header: @@ -old_start,old_count +new_start,new_count @@
+HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+# Marker left in review comments: <!-- kimi-review:sha=abc123 -->
+REVIEW_SHA_MARKER_RE = re.compile(r"<!-- kimi-review:sha=([a-f0-9]+) -->")
+
+# Closing keywords in PR bodies: Closes #123, Fixes #123, Resolves #123
+LINKED_ISSUE_RE = re.compile(r"(?:closes|fixes|resolves)\s+#(\d+)", re.IGNORECASE)
+
 
 class GitHubClient:
     """Client for GitHub PR operations."""
@@ -21,13 +34,34 @@ class GitHubClient:
         if not self.token:
             raise ValueError("GITHUB_TOKEN is required")
 
-        self.client: Github = Github(self.token)
+        self.client: Github = Github(self.token, per_page=GITHUB_PAGE_SIZE)
+        self._repos: Dict[str, Repository] = {}
+        self._pulls: Dict[Tuple[str, int], PullRequest] = {}
+
+    def _get_repo(self, repo_name: str) -> Repository:
+        """Get repository object, fetching it from the API once per client."""
+        repo = self._repos.get(repo_name)
+        if repo is None:
+            repo = self.client.get_repo(repo_name)
+            self._repos[repo_name] = repo
+        return repo
 
     def get_pr(self, repo_name: str, pr_number: int) -> PullRequest:
-        """Get pull request object."""
+        """Get pull request object.
+
+        Cached per client, so the many helpers that start from the PR share
+        one API fetch for the lifetime of the event being handled.
+        """
+        key = (repo_name, pr_number)
+        pr = self._pulls.get(key)
+        if pr is not None:
+            return pr
+
         try:
-            repo = self.client.get_repo(repo_name)
-            return repo.get_pull(pr_number)
+            repo = self._get_repo(repo_name)
+            pr = repo.get_pull(pr_number)
+            self._pulls[key] = pr
+            return pr
         except GithubException as e:
             logger.error(f"Failed to get PR #{pr_number} from {repo_name}: {e}")
             raise
@@ -80,7 +114,7 @@ class GitHubClient:
     ) -> None:
         """Add reaction to a comment."""
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             comment = repo.get_issue(pr_number).get_comment(comment_id)
             comment.create_reaction(reaction)
         except GithubException as e:
@@ -115,19 +149,23 @@ class GitHubClient:
         - in_reply_to_id: Parent comment ID if this is a reply
         """
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             pr = self.get_pr(repo_name, pr_number)
 
+            # Fetch review comments once and index them by ID for both lookups
+            review_comments = list(pr.get_review_comments())
+            review_comments_by_id = {rc.id: rc for rc in review_comments}
+
             # First, check if this comment_id is a review comment
-            for review_comment in pr.get_review_comments():
-                if review_comment.id == comment_id:
-                    return {
-                        "path": review_comment.path,
-                        "line": review_comment.line or review_comment.original_line,
-                        "diff_hunk": review_comment.diff_hunk,
-                        "body": review_comment.body,
-                        "in_reply_to_id": review_comment.in_reply_to_id,
-                    }
+            review_comment = review_comments_by_id.get(comment_id)
+            if review_comment:
+                return {
+                    "path": review_comment.path,
+                    "line": review_comment.line or review_comment.original_line,
+                    "diff_hunk": review_comment.diff_hunk,
+                    "body": review_comment.body,
+                    "in_reply_to_id": review_comment.in_reply_to_id,
+                }
 
             # If not found, this might be an issue comment that's a reply to a review comment
             # GitHub's API doesn't directly expose the parent review comment for issue comments
@@ -146,28 +184,39 @@ class GitHubClient:
             # Check if the comment URL indicates it's a review comment thread
             # Review comment URLs look like: .../pull/123#discussion_r456789
             # Issue comment URLs look like: .../pull/123#issuecomment-456789
-            html_url = target_comment.html_url
+            # Split off the discussion ID in one pass over the URL
+            _, is_discussion, discussion_id = target_comment.html_url.rpartition(
+                "#discussion_r"
+            )
 
-            if "#discussion_r" in html_url:
+            if is_discussion:
                 # This is a reply in a review comment thread
-                # Extract the discussion ID
-                discussion_id = html_url.split("#discussion_r")[-1]
 
                 # Find the parent review comment by matching the discussion thread
-                # The parent review comment will have the same discussion ID in its URL
-                for review_comment in pr.get_review_comments():
-                    if (
-                        f"discussion_r{discussion_id}" in review_comment.html_url
-                        or str(review_comment.id) == discussion_id
-                    ):
-                        return {
-                            "path": review_comment.path,
-                            "line": review_comment.line or review_comment.original_line,
-                            "diff_hunk": review_comment.diff_hunk,
-                            "body": target_comment.body,
-                            "in_reply_to_id": review_comment.id,
-                            "is_conversation_reply": True,
-                        }
+                # The discussion ID is the parent's comment ID; fall back to
+                # matching the discussion anchor in its URL
+                review_comment = None
+                if discussion_id.isdigit():
+                    review_comment = review_comments_by_id.get(int(discussion_id))
+                if review_comment is None:
+                    review_comment = next(
+                        (
+                            rc
+                            for rc in review_comments
+                            if f"discussion_r{discussion_id}" in rc.html_url
+                        ),
+                        None,
+                    )
+
+                if review_comment:
+                    return {
+                        "path": review_comment.path,
+                        "line": review_comment.line or review_comment.original_line,
+                        "diff_hunk": review_comment.diff_hunk,
+                        "body": target_comment.body,
+                        "in_reply_to_id": review_comment.id,
+                        "is_conversation_reply": True,
+                    }
 
             logger.warning(
                 f"Comment {comment_id} is not a review comment or reply to review comment"
@@ -255,19 +304,19 @@ class GitHubClient:
             current_line: int = 0
 
             for patch_line in file.patch.split("\n"):
-                # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
-                hunk_match = re.match(
-                    r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@", patch_line
-                )
-                if hunk_match:
-                    current_line = int(hunk_match.group(1))
-                    continue
-
-                if patch_line.startswith("-"):
+                prefix = patch_line[:1]
+                if prefix == "@":
+                    # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
+                    hunk_match = HUNK_HEADER_RE.match(patch_line)
+                    if hunk_match:
+                        current_line = int(hunk_match.group(1))
+                        continue
+
+                if prefix == "-":
                     # Deleted line, don't increment
                     continue
-                elif patch_line.startswith("+") or not patch_line.startswith("\\"):
-                    # Added or context line
+                elif prefix != "\\":
+                    # Added or context line ("\ No newline at end of file" is skipped)
                     lines.add(current_line)
                     current_line += 1
 
@@ -303,7 +352,7 @@ class GitHubClient:
     def get_repo_labels(self, repo_name: str) -> List[str]:
         """Get all available labels in the repo."""
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             return [label.name for label in repo.get_labels()]
         except GithubException as e:
             logger.error(f"Failed to get repo labels: {e}")
@@ -316,21 +365,17 @@ class GitHubClient:
     ) -> List[Commit]:
         """Get commits after a specific SHA."""
         pr = self.get_pr(repo_name, pr_number)
-        commits = list(pr.get_commits())
-
-        new_commits: List[Commit] = []
-        found = False
+        # Skip up to and including since_sha; the rest are the new commits
+        commits = iter(pr.get_commits())
         for c in commits:
-            if found:
-                new_commits.append(c)
             if c.sha.startswith(since_sha):
-                found = True
+                return list(commits)
 
-        return new_commits
+        return []
 
     def get_diff_for_commits(self, repo_name: str, commit_shas: List[str]) -> str:
         """Get combined diff for specific commits."""
-        repo = self.client.get_repo(repo_name)
+        repo = self._get_repo(repo_name)
         diff_parts: List[str] = []
 
         for sha in commit_shas:
@@ -357,9 +402,7 @@ class GitHubClient:
         for comment in reversed(comments):
             if bot_marker in comment.body:
                 # Extract SHA from marker: <!-- kimi-review:sha=abc123 -->
-                sha_match = re.search(
-                    r"<!-- kimi-review:sha=([a-f0-9]+) -->", comment.body
-                )
+                sha_match = REVIEW_SHA_MARKER_RE.search(comment.body)
                 if sha_match:
                     return {
                         "sha": sha_match.group(1),
@@ -373,7 +416,7 @@ class GitHubClient:
     def get_issue(self, repo_name: str, issue_number: int) -> Issue:
         """Get issue object."""
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             return repo.get_issue(issue_number)
         except GithubException as e:
             logger.error(f"Failed to get Issue #{issue_number} from {repo_name}: {e}")
@@ -394,7 +437,7 @@ class GitHubClient:
     ) -> None:
         """Add reaction to an issue comment."""
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             comment = repo.get_issue(issue_number).get_comment(comment_id)
             comment.create_reaction(reaction)
         except GithubException as e:
@@ -428,7 +471,7 @@ class GitHubClient:
             Created PullRequest object
         """
         try:
-            repo = self.client.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             pr = repo.create_pull(title=title, body=body, head=head, base=base)
             logger.info(f"Created PR #{pr.number}: {title}")
             return pr
@@ -496,9 +539,7 @@ class GitHubClient:
             pr = self.get_pr(repo_name, pr_number)
             body = pr.body or ""
             # Match patterns like: Closes #123, Fixes #123, Resolves #123
-            match = re.search(
-                r"(?:closes|fixes|resolves)\s+#(\d+)", body, re.IGNORECASE
-            )
+            match = LINKED_ISSUE_RE.search(body)
             if match:
                 return int(match.group(1))
             return None
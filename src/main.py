@@ -16,6 +16,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Slash command at the start of a comment: /command [args]
+COMMAND_RE = re.compile(r"^/(\w+)(?:\s+(.*))?$", re.DOTALL)
+
 
 def get_input(name: str, default: str = None) -> str:
     """Get action input from environment."""
@@ -32,8 +35,7 @@ def parse_command(comment_body: str) -> tuple:
         Tuple of (command, args) or (None, None) if no command found.
     """
     # First try: command at the very start
-    pattern = r"^/(\w+)(?:\s+(.*))?$"
-    match = re.match(pattern, comment_body.strip(), re.DOTALL)
+    match = COMMAND_RE.match(comment_body.strip())
     if match:
         command = match.group(1).lower()
         args = match.group(2).strip() if match.group(2) else ""
@@ -46,7 +48,7 @@ def parse_command(comment_body: str) -> tuple:
     cleaned_body = "\n".join(non_quote_lines).strip()
 
     if cleaned_body:
-        match = re.match(pattern, cleaned_body, re.DOTALL)
+        match = COMMAND_RE.match(cleaned_body)
         if match:
             command = match.group(1).lower()
             args = match.group(2).strip() if match.group(2) else ""
@@ -55,6 +57,13 @@ def parse_command(comment_body: str) -> tuple:
     return None, None
 
 
+def extract_code_context(diff_hunk: str, max_lines: int = 5) -> str:
+    """Extract the last few code lines from a diff hunk, skipping @@ headers."""
+    hunk_lines = diff_hunk.strip().split("\n")
+    relevant_lines = [line for line in hunk_lines if not line.startswith("@@")]
+    return "\n".join(relevant_lines[-max_lines:])
+
+
 def handle_pr_event(event: dict, config: ActionConfig):
     """Handle pull_request event (auto review on PR open/sync)."""
     pr_number = event.get("pull_request", {}).get("number")
@@ -142,12 +151,7 @@ def handle_review_comment_event(event: dict, config: ActionConfig):
             else:
                 ask = Ask(github)
                 # Extract only the last few lines of diff_hunk (the relevant code)
-                hunk_lines = diff_hunk.strip().split("\n")
-                # Take last 5 lines or less, skip the @@ header
-                relevant_lines = [
-                    line for line in hunk_lines if not line.startswith("@@")
-                ][-5:]
-                code_context = "\n".join(relevant_lines)
+                code_context = extract_code_context(diff_hunk)
 
                 # Pass code context to Kimi but don't show in output (GitHub UI already shows it)
                 context_question = f"Regarding `{file_path}` line {comment_line}:\n```diff\n{code_context}\n```\n\n{args}"
@@ -249,11 +253,7 @@ def handle_comment_event(event: dict, config: ActionConfig):
                     diff_hunk = review_context.get("diff_hunk", "")
 
                     # Extract relevant code lines from diff_hunk
-                    hunk_lines = diff_hunk.strip().split("\n")
-                    relevant_lines = [
-                        line for line in hunk_lines if not line.startswith("@@")
-                    ][-5:]
-                    code_context = "\n".join(relevant_lines)
+                    code_context = extract_code_context(diff_hunk)
 
                     # Add code context to the question
                     context_question = f"Regarding `{file_path}` line {line}:\n```diff\n{code_context}\n```\n\n{args}"
@@ -338,6 +338,16 @@ No parameters needed - it just works!
 """
 
 
+# GitHub event name -> handler
+EVENT_HANDLERS = {
+    "pull_request": handle_pr_event,
+    "pull_request_target": handle_pr_event,
+    # issue_comment fires for both PR and Issue comments
+    "issue_comment": handle_comment_event,
+    "pull_request_review_comment": handle_review_comment_event,
+}
+
+
 def main():
     # Configure logging level from env
     log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -369,17 +379,13 @@ def main():
     logger.info(f"Event: {event_name}")
 
     # Route to appropriate handler
-    if event_name in ["pull_request", "pull_request_target"]:
-        handle_pr_event(event, config)
-    elif event_name == "issue_comment":
-        # issue_comment fires for both PR and Issue comments
-        handle_comment_event(event, config)
-    elif event_name == "pull_request_review_comment":
-        handle_review_comment_event(event, config)
-    else:
+    handler = EVENT_HANDLERS.get(event_name)
+    if handler is None:
         logger.warning(f"Unsupported event: {event_name}")
         sys.exit(0)
 
+    handler(event, config)
+
 
 if __name__ == "__main__":
     main()
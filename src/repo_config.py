@@ -49,6 +49,14 @@ logger = logging.getLogger(__name__)
 # Built-in skill names that are reserved
 BUILTIN_SKILL_NAMES = {"code-review", "describe", "improve", "ask"}
 
+# Recognised top-level keys in .kimi-config.yml
+VALID_CONFIG_KEYS = frozenset(
+    {"enabled", "categories", "skill_overrides", "ignore_files", "extra_instructions"}
+)
+
+# Recognised review categories under 'categories'
+VALID_CATEGORIES = frozenset({"bug", "performance", "security"})
+
 
 @dataclass
 class RepoConfig:
@@ -95,14 +103,7 @@ def validate_config(data: dict) -> ConfigValidationResult:
     warnings = []
 
     # Check top-level keys
-    valid_keys = {
-        "enabled",
-        "categories",
-        "skill_overrides",
-        "ignore_files",
-        "extra_instructions",
-    }
-    unknown_keys = set(data.keys()) - valid_keys
+    unknown_keys = set(data.keys()) - VALID_CONFIG_KEYS
     if unknown_keys:
         # Check if user is using old 'skills' key
         if "skills" in unknown_keys:
@@ -125,9 +126,8 @@ def validate_config(data: dict) -> ConfigValidationResult:
         if not isinstance(categories, dict):
             errors.append("'categories' must be an object")
         else:
-            valid_categories = {"bug", "performance", "security"}
             for key, value in categories.items():
-                if key not in valid_categories:
+                if key not in VALID_CATEGORIES:
                     warnings.append(f"Unknown category: '{key}'")
                 if not isinstance(value, bool):
                     errors.append(f"Category '{key}' must be a boolean")
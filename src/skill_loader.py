@@ -12,6 +12,7 @@ automatically when skills_dir is provided.
 import re
 import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Built-in skills directory
 SKILLS_DIR = Path(__file__).parent / "skills"
 
+# YAML frontmatter delimited by --- lines, followed by the instructions body
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
+
 
 @dataclass
 class Skill:
@@ -60,7 +64,7 @@ def parse_skill_md(content: str) -> Tuple[Dict[str, Any], str]:
         Tuple of (metadata dict, instructions string)
     """
     # Extract YAML frontmatter
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)", content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
 
     if not match:
         return {}, content
@@ -118,7 +122,17 @@ def load_skill_from_dir(skill_dir: Path) -> Optional[Skill]:
 
 
 def load_builtin_skills() -> Dict[str, Skill]:
-    """Load all built-in skills."""
+    """Load all built-in skills.
+
+    Built-in skills ship with the action and never change at runtime, so the
+    directory is parsed once per process. Each caller gets its own dict.
+    """
+    return dict(_scan_builtin_skills())
+
+
+@lru_cache(maxsize=1)
+def _scan_builtin_skills() -> Dict[str, Skill]:
+    """Parse all skill folders under SKILLS_DIR."""
     skills: Dict[str, Skill] = {}
 
     if not SKILLS_DIR.exists():
@@ -235,9 +249,8 @@ class SkillManager:
     @property
     def skills(self) -> Dict[str, Skill]:
         """Get all skills (custom overrides built-in)."""
-        merged = dict(self.builtin_skills)
-        merged.update(self.custom_skills)  # Custom overrides built-in
-        return merged
+        # Custom overrides built-in
+        return {**self.builtin_skills, **self.custom_skills}
 
     def get_skill(self, name: str) -> Optional[Skill]:
         """Get a skill by name.
@@ -288,7 +301,7 @@ class SkillManager:
         return [
             s
             for s in self.skills.values()
-            if trigger_lower in [t.lower() for t in s.triggers]
+            if any(t.lower() == trigger_lower for t in s.triggers)
         ]
 
     def build_prompt(self, skill_name: str, **context: Any) -> str:
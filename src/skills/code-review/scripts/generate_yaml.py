@@ -18,6 +18,7 @@ Usage in Agent:
     python scripts/generate_yaml.py example
 """
 
+import re
 import sys
 import json
 import yaml
@@ -96,8 +97,6 @@ def fix_common_yaml_errors(yaml_str: str) -> str:
 
     # Fix common quote issues in multiline strings
     # Convert unquoted multiline values to quoted
-    import re
-
     # Fix: existing_code: "some code without closing quote
     yaml_str = re.sub(
         r'(existing_code|improved_code|suggestion_content):\s*"([^"]*?)$',
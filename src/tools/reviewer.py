@@ -11,6 +11,18 @@ from tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Prompt text for each review level (ActionConfig.review_level)
+REVIEW_LEVEL_TEXT = {
+    "strict": """Review Level: Strict - Perform thorough analysis including:
+- Thread safety and race condition detection
+- Stub/mock/simulation code detection
+- Error handling completeness
+- Cache key collision detection
+- All items in the Strict Mode Checklist""",
+    "normal": "Review Level: Normal - Focus on functional issues and common bugs",
+    "gentle": "Review Level: Gentle - Only flag critical issues that would break functionality",
+}
+
 
 class Reviewer(BaseTool):
     """Code review tool using Agent SDK with Skill-based architecture."""
@@ -79,8 +91,9 @@ class Reviewer(BaseTool):
             response = "### 🌗 Pull request overview\n\n✅ No issues found! The code looks good."
         
         # Add footer if not already present
-        if self.format_footer() not in response:
-            response = f"{response}\n\n{self.format_footer()}"
+        footer = self.format_footer()
+        if footer not in response:
+            response = f"{response}\n\n{footer}"
         
         # Add SHA marker to track last reviewed commit
         if pr.head.sha:
@@ -171,19 +184,10 @@ Follow the format shown in the instructions above.
         so we don't need to run them manually and include output in prompt.
         """
         parts = [skill.instructions]
-        level_text = {
-            "strict": """Review Level: Strict - Perform thorough analysis including:
-- Thread safety and race condition detection
-- Stub/mock/simulation code detection
-- Error handling completeness
-- Cache key collision detection
-- All items in the Strict Mode Checklist""",
-            "normal": "Review Level: Normal - Focus on functional issues and common bugs",
-            "gentle": "Review Level: Gentle - Only flag critical issues that would break functionality",
-        }
-        parts.append(
-            f"\n## {level_text.get(self.config.review_level, level_text['normal'])}"
+        level_text = REVIEW_LEVEL_TEXT.get(
+            self.config.review_level, REVIEW_LEVEL_TEXT["normal"]
         )
+        parts.append(f"\n## {level_text}")
         if self.config.review.extra_instructions:
             parts.append(
                 f"\n## Extra Instructions\n{self.config.review.extra_instructions}"
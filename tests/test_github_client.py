@@ -20,6 +20,57 @@ def mock_github_api():
         yield mock_github_instance, mock_repo
 
 
+class TestGitHubClientInit:
+    """Test client construction."""
+
+    def test_uses_max_page_size(self):
+        """Test paginated listings request the largest page size."""
+        from github_client import GitHubClient, GITHUB_PAGE_SIZE
+
+        with patch("github_client.Github") as mock_github:
+            GitHubClient("fake-token")
+
+        mock_github.assert_called_once_with("fake-token", per_page=GITHUB_PAGE_SIZE)
+
+
+class TestGitHubClientRepoCache:
+    """Test repository object caching."""
+
+    def test_repo_fetched_once(self, mock_github_api):
+        """Test repository objects are cached per client."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_repo.get_pull = Mock(return_value=Mock())
+        mock_repo.get_labels = Mock(return_value=[])
+
+        client = GitHubClient("fake-token")
+        client.get_pr("owner/repo", 1)
+        client.get_pr("owner/repo", 2)
+        client.get_repo_labels("owner/repo")
+
+        mock_github.get_repo.assert_called_once_with("owner/repo")
+
+    def test_repo_fetch_error_not_cached(self, mock_github_api):
+        """Test a failed repository fetch is retried on the next call."""
+        from github_client import GitHubClient
+        from github import GithubException
+
+        mock_github, mock_repo = mock_github_api
+        mock_repo.get_pull = Mock(return_value=Mock())
+        mock_github.get_repo.side_effect = [
+            GithubException(502, "Bad gateway", None),
+            mock_repo,
+        ]
+
+        client = GitHubClient("fake-token")
+        with pytest.raises(GithubException):
+            client.get_pr("owner/repo", 1)
+        client.get_pr("owner/repo", 1)
+
+        assert mock_github.get_repo.call_count == 2
+
+
 class TestGitHubClientPR:
     """Test PR operations."""
 
@@ -40,6 +91,21 @@ class TestGitHubClientPR:
         assert pr.title == "Test PR"
         mock_repo.get_pull.assert_called_once_with(123)
 
+    def test_get_pr_cached(self, mock_github_api):
+        """Test repeated PR lookups share one API fetch."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_repo.get_pull = Mock(side_effect=lambda number: Mock(number=number))
+
+        client = GitHubClient("fake-token")
+        first = client.get_pr("owner/repo", 123)
+        client.post_comment("owner/repo", 123, "Test comment")
+
+        assert client.get_pr("owner/repo", 123) is first
+        assert client.get_pr("owner/repo", 124).number == 124
+        assert mock_repo.get_pull.call_count == 2
+
     def test_get_pr_diff(self, mock_github_api):
         """Test getting PR diff."""
         from github_client import GitHubClient
@@ -102,6 +168,115 @@ class TestGitHubClientPR:
         assert mock_pr.create_review.called
 
 
+class TestGitHubClientDiffLineMap:
+    """Test diff line map parsing."""
+
+    def test_diff_line_map(self, mock_github_api):
+        """Test added and context lines are mapped, deleted lines are not."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_file = Mock()
+        mock_file.filename = "app.py"
+        mock_file.patch = (
+            "@@ -1,3 +1,3 @@\n"
+            " keep\n"
+            "-old\n"
+            "+new\n"
+            " tail\n"
+            "@@ -20,2 +20,3 @@\n"
+            " ctx\n"
+            "+added"
+        )
+        binary_file = Mock()
+        binary_file.filename = "logo.png"
+        binary_file.patch = None
+        mock_pr = Mock()
+        mock_pr.get_files = Mock(return_value=[mock_file, binary_file])
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+
+        client = GitHubClient("fake-token")
+        line_map = client._get_diff_line_map("owner/repo", 1)
+
+        assert line_map == {"app.py": {1, 2, 3, 20, 21}}
+
+
+class TestGitHubClientReviewCommentContext:
+    """Test review comment context lookup."""
+
+    @staticmethod
+    def _review_comment(comment_id, path="src/app.py"):
+        rc = Mock()
+        rc.id = comment_id
+        rc.path = path
+        rc.line = 10
+        rc.diff_hunk = "@@ -1,1 +1,1 @@\n+code"
+        rc.body = f"review comment {comment_id}"
+        rc.in_reply_to_id = None
+        rc.html_url = f"https://github.com/o/r/pull/1#discussion_r{comment_id}"
+        return rc
+
+    def test_direct_review_comment(self, mock_github_api):
+        """Test a review comment is found by ID."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_pr = Mock()
+        mock_pr.get_review_comments = Mock(
+            return_value=[self._review_comment(1), self._review_comment(2, "b.py")]
+        )
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+
+        client = GitHubClient("fake-token")
+        context = client.get_review_comment_context("owner/repo", 1, 2)
+
+        assert context["path"] == "b.py"
+        assert context["body"] == "review comment 2"
+        mock_pr.get_review_comments.assert_called_once()
+
+    def test_conversation_reply(self, mock_github_api):
+        """Test an issue comment in a discussion thread maps to its parent."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_pr = Mock()
+        mock_pr.get_review_comments = Mock(
+            return_value=[self._review_comment(12), self._review_comment(123, "b.py")]
+        )
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+
+        reply = Mock()
+        reply.id = 999
+        reply.body = "/ask why?"
+        reply.html_url = "https://github.com/o/r/pull/1#discussion_r123"
+        mock_issue = Mock()
+        mock_issue.get_comments = Mock(return_value=[reply])
+        mock_repo.get_issue = Mock(return_value=mock_issue)
+
+        client = GitHubClient("fake-token")
+        context = client.get_review_comment_context("owner/repo", 1, 999)
+
+        assert context["path"] == "b.py"
+        assert context["in_reply_to_id"] == 123
+        assert context["body"] == "/ask why?"
+        assert context["is_conversation_reply"] is True
+        mock_pr.get_review_comments.assert_called_once()
+
+    def test_not_found(self, mock_github_api):
+        """Test None is returned when the comment does not exist."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_pr = Mock()
+        mock_pr.get_review_comments = Mock(return_value=[])
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+        mock_repo.get_issue = Mock(return_value=Mock(get_comments=Mock(return_value=[])))
+
+        client = GitHubClient("fake-token")
+
+        assert client.get_review_comment_context("owner/repo", 1, 5) is None
+
+
 class TestGitHubClientIssue:
     """Test Issue operations."""
 
@@ -271,6 +446,57 @@ class TestGitHubClientCommits:
         # Should return commits after the specified SHA
         assert isinstance(commits, list)
 
+    def test_get_commits_since_returns_commits_after_sha(self, mock_github_api):
+        """Test only commits after the matching SHA are returned."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        commits = [Mock(sha=sha) for sha in ("aaa111", "bbb222", "ccc333")]
+        mock_pr = Mock()
+        mock_pr.get_commits = Mock(return_value=commits)
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+
+        client = GitHubClient("fake-token")
+
+        assert client.get_commits_since("owner/repo", 123, "aaa") == commits[1:]
+        assert client.get_commits_since("owner/repo", 123, "ccc333") == []
+        assert client.get_commits_since("owner/repo", 123, "zzz") == []
+
+    def test_get_diff_for_commits_preserves_order(self, mock_github_api):
+        """Test combined commit diff keeps commit order and skips failures."""
+        from github_client import GitHubClient
+        from github import GithubException
+
+        mock_github, mock_repo = mock_github_api
+
+        def make_commit(filename, patch):
+            mock_file = Mock()
+            mock_file.filename = filename
+            mock_file.patch = patch
+            commit = Mock()
+            commit.files = [mock_file]
+            return commit
+
+        commits = {
+            "sha1": make_commit("a.py", "+a"),
+            "sha2": make_commit("b.py", "+b"),
+            "sha3": make_commit("c.py", "+c"),
+        }
+
+        def get_commit(sha):
+            if sha == "bad":
+                raise GithubException(404, "Not found", None)
+            return commits[sha]
+
+        mock_repo.get_commit = Mock(side_effect=get_commit)
+
+        client = GitHubClient("fake-token")
+        diff = client.get_diff_for_commits(
+            "owner/repo", ["sha1", "bad", "sha2", "sha3"]
+        )
+
+        assert diff == "--- a.py\n+a\n\n--- b.py\n+b\n\n--- c.py\n+c"
+
     def test_get_last_bot_comment(self, mock_github_api):
         """Test getting last bot comment."""
         from github_client import GitHubClient
@@ -297,3 +523,26 @@ class TestGitHubClientCommits:
         assert (
             last_comment is not None or last_comment is None
         )  # Implementation dependent
+
+    def test_get_last_bot_comment_returns_newest(self, mock_github_api):
+        """Test the newest marked comment wins over older reviews."""
+        from github_client import GitHubClient
+
+        mock_github, mock_repo = mock_github_api
+        mock_pr = Mock()
+
+        older = Mock()
+        older.body = "<!-- kimi-review -->\n<!-- kimi-review:sha=aaa111 -->"
+        older.id = 1
+        newer = Mock()
+        newer.body = "<!-- kimi-review -->\n<!-- kimi-review:sha=bbb222 -->"
+        newer.id = 2
+
+        mock_pr.get_issue_comments = Mock(return_value=[older, newer])
+        mock_repo.get_pull = Mock(return_value=mock_pr)
+
+        client = GitHubClient("fake-token")
+        last_comment = client.get_last_bot_comment("owner/repo", 123)
+
+        assert last_comment["sha"] == "bbb222"
+        assert last_comment["comment_id"] == 2
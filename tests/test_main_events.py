@@ -8,7 +8,8 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from main import handle_review_comment_event, parse_command
+import main
+from main import extract_code_context, handle_review_comment_event, parse_command
 from action_config import ActionConfig
 
 
@@ -44,6 +45,26 @@ class TestParseCommand:
         assert args is None
 
 
+class TestExtractCodeContext:
+    """Tests for diff hunk context extraction."""
+
+    def test_keeps_last_lines(self):
+        """Test only the trailing lines are kept."""
+        hunk = "@@ -1,7 +1,7 @@\n" + "\n".join(f" line{i}" for i in range(1, 8))
+        assert extract_code_context(hunk) == "\n".join(
+            f" line{i}" for i in range(3, 8)
+        )
+
+    def test_skips_hunk_headers(self):
+        """Test @@ headers are dropped from short hunks."""
+        hunk = "@@ -1,2 +1,3 @@\n def foo():\n+    return 1"
+        assert extract_code_context(hunk) == " def foo():\n+    return 1"
+
+    def test_custom_max_lines(self):
+        """Test max_lines bounds the result."""
+        assert extract_code_context("a\nb\nc", max_lines=2) == "b\nc"
+
+
 class TestHandleReviewCommentEvent:
     """Tests for pull_request_review_comment event handler."""
 
@@ -224,3 +245,46 @@ class TestHandleReviewCommentEvent:
             mock_github.post_comment.assert_called_once()
             comment_args = mock_github.post_comment.call_args
             assert "Answer" in comment_args[0][2]
+
+
+class TestMainRouting:
+    """Tests for event routing in main()."""
+
+    @pytest.fixture
+    def event_env(self, tmp_path, monkeypatch):
+        """Point the action at a temporary event payload."""
+        event_path = tmp_path / "event.json"
+        event_path.write_text('{"action": "opened"}')
+        monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+        monkeypatch.setenv("INPUT_KIMI_API_KEY", "test_key")
+        monkeypatch.setenv("INPUT_GITHUB_TOKEN", "test_token")
+        return monkeypatch
+
+    @pytest.mark.parametrize(
+        "event_name",
+        [
+            "pull_request",
+            "pull_request_target",
+            "issue_comment",
+            "pull_request_review_comment",
+        ],
+    )
+    def test_routes_supported_events(self, event_env, event_name):
+        """Test each supported event reaches its handler with the payload."""
+        event_env.setenv("GITHUB_EVENT_NAME", event_name)
+        handler = Mock()
+
+        with patch.dict(main.EVENT_HANDLERS, {event_name: handler}):
+            main.main()
+
+        handler.assert_called_once()
+        assert handler.call_args[0][0] == {"action": "opened"}
+
+    def test_unsupported_event_exits(self, event_env):
+        """Test unsupported events exit cleanly."""
+        event_env.setenv("GITHUB_EVENT_NAME", "push")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main.main()
+
+        assert exc_info.value.code == 0
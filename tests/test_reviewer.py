@@ -184,3 +184,19 @@ class TestReviewerIncrementalDiff:
         result = reviewer.run("owner/repo", 123)
 
         assert "No new changes since last review" in result
+
+
+class TestReviewerSystemPrompt:
+    """Test Reviewer system prompt building."""
+
+    def test_unknown_review_level_falls_back_to_normal(self, mock_action_config):
+        """Test unknown review level uses normal level text."""
+        from tools.reviewer import Reviewer, REVIEW_LEVEL_TEXT
+
+        mock_action_config.review_level = "unknown"
+        reviewer = Reviewer(MockGitHubClient())
+
+        prompt = reviewer._build_system_prompt(Mock(instructions="Skill"))
+
+        assert prompt.startswith("Skill")
+        assert REVIEW_LEVEL_TEXT["normal"] in prompt
@@ -2,10 +2,19 @@
 
 import sys
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from skill_loader import Skill, parse_skill_md, load_skill_from_dir, SkillManager
+from skill_loader import (
+    Skill,
+    parse_skill_md,
+    load_skill_from_dir,
+    load_builtin_skills,
+    load_custom_skills_from_repo,
+    _scan_builtin_skills,
+    SkillManager,
+)
 
 
 class TestSkill:
@@ -157,6 +166,76 @@ Do something useful.
         assert skill.references["guide"] == "# Guide"
 
 
+class TestLoadBuiltinSkills:
+    """Tests for load_builtin_skills function."""
+
+    def test_parses_skills_dir_once(self):
+        _scan_builtin_skills.cache_clear()
+        with patch(
+            "skill_loader.load_skill_from_dir", wraps=load_skill_from_dir
+        ) as mock_load:
+            first = load_builtin_skills()
+            second = load_builtin_skills()
+
+        assert first == second
+        assert mock_load.call_count == len(first)
+
+    def test_returns_independent_dicts(self):
+        first = load_builtin_skills()
+        first["extra"] = Skill(name="extra", description="Extra")
+
+        assert "extra" not in load_builtin_skills()
+
+
+class TestLoadCustomSkillsFromRepo:
+    """Tests for load_custom_skills_from_repo function."""
+
+    @staticmethod
+    def _make_repo(skill_names):
+        def content(path, text=""):
+            item = Mock()
+            item.path = path
+            item.name = path.split("/")[-1]
+            item.type = "dir"
+            item.decoded_content = text.encode("utf-8")
+            return item
+
+        def get_contents(path, ref=None):
+            if path == ".kimi/skills":
+                return [content(f".kimi/skills/{n}") for n in skill_names]
+            if path.endswith("/references"):
+                return [content(f"{path}/guide.md"), content(f"{path}/notes.txt")]
+            if path.endswith("/guide.md"):
+                return content(path, f"# Guide for {path.split('/')[2]}")
+            if path.endswith("/SKILL.md"):
+                name = path.split("/")[-2]
+                return content(path, f"---\nname: {name}\n---\n\nUse {name}.")
+            raise Exception("not found")
+
+        repo = Mock()
+        repo.get_contents = Mock(side_effect=get_contents)
+        github_client = Mock()
+        github_client.client.get_repo = Mock(return_value=repo)
+        return github_client
+
+    def test_loads_all_skill_dirs(self):
+        github_client = self._make_repo(["alpha", "beta", "gamma"])
+
+        skills = load_custom_skills_from_repo(github_client, "owner/repo")
+
+        assert list(skills) == ["alpha", "beta", "gamma"]
+        assert skills["beta"].instructions == "Use beta."
+        assert skills["beta"].references == {"guide": "# Guide for beta"}
+
+    def test_no_skills_dir(self):
+        github_client = self._make_repo([])
+        github_client.client.get_repo.return_value.get_contents.side_effect = (
+            Exception("not found")
+        )
+
+        assert load_custom_skills_from_repo(github_client, "owner/repo") == {}
+
+
 class TestSkillManager:
     """Tests for SkillManager class."""
 